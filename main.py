@@ -1,5 +1,47 @@
 import struct
 import hashlib
+import re
+import sys
+from array import array
+from collections.abc import Mapping, Set
+from bisect import bisect_right
+from functools import partial
+from itertools import accumulate, repeat, starmap
+from operator import itemgetter
+
+# Precomputed encodings of the single-byte values 0..252, shared by every call.
+_SMALL = tuple(bytes((value,)) for value in range(0xFD))
+# ...and the matching decode results, (value, bytes consumed), shared the same way.
+_SMALL_DECODED = tuple((value, 1) for value in range(0xFD))
+
+# Precompiled CompactSize packers: prefix byte + little-endian payload in one call.
+_PACK_FD = struct.Struct('<BH').pack
+_PACK_FE = struct.Struct('<BI').pack
+_PACK_FF = struct.Struct('<BQ').pack
+
+# Prefix-bound packers for values >= 0xFD, indexed by `value.bit_length()` (0..64).
+_ENCODE_BY_BITS = (
+    (partial(_PACK_FD, 0xFD),) * 17
+    + (partial(_PACK_FE, 0xFE),) * 16
+    + (partial(_PACK_FF, 0xFF),) * 32
+)
+
+# Precompiled CompactSize payload readers; unpack_from reads in place without slicing.
+_UP_H = struct.Struct('<H').unpack_from
+_UP_I = struct.Struct('<I').unpack_from
+_UP_Q = struct.Struct('<Q').unpack_from
+
+# CompactSize lookup tables indexed by the first byte: total bytes consumed, and the
+# payload reader (None when the first byte is the value itself).
+_CS_CONSUMED = bytes([1] * 0xFD + [3, 5, 9])
+_CS_READERS = (None,) * 0xFD + (_UP_H, _UP_I, _UP_Q)
+
+# Matches any multi-byte CompactSize prefix, to find runs of single-byte values in bulk.
+_MULTIBYTE_PREFIX = re.compile(rb'[\xfd-\xff]')
+
+# Block header fields before the nonce: version, prev block hash, merkle root, timestamp, bits.
+_HEADER_PREFIX = struct.Struct('<I32s32sII')
+_PACK_NONCE_INTO = struct.Struct('<I').pack_into
 
 class CompactSizeEncoder:
     """
@@ -27,94 +69,267 @@ class CompactSizeEncoder:
         """
         # 1. Add validation for `value`: must be a non-negative integer and fit within u64 (0 to 18446744073709551615).
         #    Raise ValueError for invalid inputs.
-        if not isinstance(value, int) or value < 0:
+        #    The exact-type check short-circuits isinstance() for plain ints, and a single shift
+        #    catches both negatives and values above u64 max (18446744073709551615).
+        if value.__class__ is not int and not isinstance(value, int):
             raise ValueError("Value must be a non-negative integer")
         
-        if value > 18446744073709551615:  # u64 max
+        if value >> 64:
+            if value < 0:
+                raise ValueError("Value must be a non-negative integer")
             raise ValueError("Value exceeds u64 maximum")
         
-        # 2. Use `if/elif/else` to check the `value` range against 0xFD, 0xFFFF, 0xFFFFFFFF.
+        # 2. Small values (the common case) come straight from the shared table;
+        #    larger ones go through the unchecked encoder.
+        if value < 0xFD:
+            return _SMALL[value]
+        return self.encode_trusted(value)
+
+    def encode_trusted(self, value: int, _small=_SMALL, _by_bits=_ENCODE_BY_BITS) -> bytes:
+        """
+        Encodes an integer into CompactSize bytes without validating it.
+
+        The caller guarantees `value` is an int in the u64 range (0 to 18446744073709551615).
+        Anything else gives undefined results; use `encode` for untrusted input.
+
+        Args:
+            value (int): The integer to encode.
+
+        Returns:
+            bytes: The CompactSize byte representation.
+        """
         if value < 0xFD:  # 253
-            # Single byte encoding - no prefix needed
-            return value.to_bytes(1, byteorder='little')
-        elif value <= 0xFFFF:  # 65535
-            # 2-byte encoding with 0xFD prefix
-            return bytes([0xFD]) + value.to_bytes(2, byteorder='little')
-        elif value <= 0xFFFFFFFF:  # 4294967295
-            # 4-byte encoding with 0xFE prefix
-            return bytes([0xFE]) + value.to_bytes(4, byteorder='little')
-        else:
-            # 8-byte encoding with 0xFF prefix
-            return bytes([0xFF]) + value.to_bytes(8, byteorder='little')
+            # Single byte encoding - no prefix needed; return the shared precomputed bytes
+            return _small[value]
+        # Larger values pick their prefixed packer by bit length: up to 16 bits -> 0xFD,
+        # up to 32 bits -> 0xFE, otherwise 0xFF.
+        return _by_bits[value.bit_length()](value)
+
+    def encode_many(self, values: list[int]) -> bytes:
+        """
+        Encodes an iterable of integers into back-to-back CompactSize bytes.
+        If every value is an int that fits in a single byte, the whole batch is converted
+        by `bytes()`; otherwise the encodings are written into a single growing bytearray.
+
+        Args:
+            values (list[int]): The integers to encode; any iterable is accepted.
+
+        Returns:
+            bytes: The concatenated CompactSize encodings.
+
+        Raises:
+            ValueError: If any value is negative or exceeds u64 max.
+        """
+        # Both paths may walk the values, so materialize one-shot iterators first.
+        if values.__class__ is not list and values.__class__ is not tuple:
+            values = list(values)
+        
+        # Fast path: single-byte values encode to themselves. bytes() also accepts
+        # `__index__` objects, so only take it when every value is a real int, as `encode` requires.
+        small = None
+        if all(map(isinstance, values, repeat(int))):
+            try:
+                small = bytes(values)
+            except ValueError:
+                pass
+        if small is not None and _MULTIBYTE_PREFIX.search(small) is None:
+            return small
+        
+        # Mixed widths: write everything into one growing buffer. Single-byte values are
+        # appended in place; wider ones add a prefix+payload packed in one call.
+        buf = bytearray()
+        append = buf.append
+        for value in values:
+            if value.__class__ is not int and not isinstance(value, int):
+                raise ValueError("Value must be a non-negative integer")
+            if value < 0xFD:
+                if value < 0:
+                    raise ValueError("Value must be a non-negative integer")
+                append(value)
+            elif value <= 0xFFFF:
+                buf += _PACK_FD(0xFD, value)
+            elif value <= 0xFFFFFFFF:
+                buf += _PACK_FE(0xFE, value)
+            elif value <= 18446744073709551615:  # u64 max
+                buf += _PACK_FF(0xFF, value)
+            else:
+                raise ValueError("Value exceeds u64 maximum")
+        return bytes(buf)
 
 class CompactSizeDecoder:
     """
     Decodes Bitcoin's CompactSize bytes into an integer.
     """
-    def decode(self, data: bytes) -> tuple[int, int]:
+    def decode(self, data: bytes, offset: int = 0) -> tuple[int, int]:
         """
         Decodes a CompactSize integer from the beginning of a byte sequence.
+        Passing `offset` decodes in place from further into a buffer, without slicing it.
 
         Args:
             data (bytes): The byte sequence to decode from.
+            offset (int): The non-negative position of the CompactSize prefix in `data`.
 
         Returns:
             tuple[int, int]: A tuple containing the decoded integer value
                              and the number of bytes consumed.
 
         Raises:
-            ValueError: If data is too short or has an invalid prefix.
-        """
-        # 1. Check if `data` is empty. If so, raise ValueError ("Data is too short to decode CompactSize.").
-        if not data:
+            ValueError: If `offset` is negative, or data is too short for its prefix.
+        """
+        # A negative offset would index from the end of `data`; reject it explicitly.
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+        # 1. Check if `data` is empty from `offset` on. If so, raise ValueError ("Data is too short to decode CompactSize.").
+        remaining = len(data) - offset
+        if remaining <= 0:
             raise ValueError("Data is too short to decode CompactSize.")
         
-        # 2. Get the `first_byte` from `data[0]`.
-        first_byte = data[0]
-        
-        # 3. Use `if/elif/else` to determine the length based on `first_byte`:
+        # 2. Get the `first_byte` from `data[offset]`; prefixes below 0xFD are the value itself.
+        first_byte = data[offset]
         if first_byte < 0xFD:
-            # The value is the `first_byte` itself; 1 byte consumed.
-            return first_byte, 1
-        elif first_byte == 0xFD:
-            # Expect 2 more bytes. Check `len(data)` is at least 3.
-            if len(data) < 3:
-                raise ValueError("Data too short")
-            # Convert `data[1:3]` to int using `int.from_bytes()` with `byteorder='little'`. 3 bytes consumed.
-            value = int.from_bytes(data[1:3], byteorder='little')
-            return value, 3
-        elif first_byte == 0xFE:
-            # Expect 4 more bytes. Check `len(data)` is at least 5.
-            if len(data) < 5:
-                raise ValueError("Data too short")
-            # Convert `data[1:5]` to int. 5 bytes consumed.
-            value = int.from_bytes(data[1:5], byteorder='little')
-            return value, 5
-        elif first_byte == 0xFF:
-            # Expect 8 more bytes. Check `len(data)` is at least 9.
-            if len(data) < 9:
+            return _SMALL_DECODED[first_byte]
+        
+        # 3. Otherwise look up the total length, check the payload is present, and read it in place.
+        consumed = _CS_CONSUMED[first_byte]
+        if remaining < consumed:
+            raise ValueError("Data too short")
+        return _CS_READERS[first_byte](data, offset + 1)[0], consumed
+
+    def decode_many(self, data: bytes, count: int) -> tuple[list[int], int]:
+        """
+        Decodes `count` consecutive CompactSize integers from a byte sequence.
+        Runs of single-byte values are copied out in bulk; multi-byte values are read
+        from a single memoryview with unpack_from instead of slicing per value.
+
+        Args:
+            data (bytes): The byte sequence to decode from.
+            count (int): How many integers to decode.
+
+        Returns:
+            tuple[list[int], int]: The decoded integers and the total number of bytes consumed.
+
+        Raises:
+            ValueError: If data runs out before `count` integers are decoded.
+        """
+        view = memoryview(data)
+        size = len(view)
+        find_multibyte = _MULTIBYTE_PREFIX.search
+        values = []
+        offset = 0
+        while len(values) < count:
+            # Every byte before the next multi-byte prefix is a complete single-byte value.
+            end = min(offset + count - len(values), size)
+            match = find_multibyte(view, offset, end)
+            stop = match.start() if match else end
+            values.extend(view[offset:stop])
+            offset = stop
+            if len(values) == count:
+                break
+            if offset >= size:
+                raise ValueError("Data is too short to decode CompactSize.")
+            first_byte = view[offset]
+            consumed = _CS_CONSUMED[first_byte]
+            if size - offset < consumed:
                 raise ValueError("Data too short")
-            # Convert `data[1:9]` to int. 9 bytes consumed.
-            value = int.from_bytes(data[1:9], byteorder='little')
-            return value, 9
-        else:
-            raise ValueError(f"Invalid CompactSize prefix: {first_byte}")
+            values.append(_CS_READERS[first_byte](view, offset + 1)[0])
+            offset += consumed
+        return values, offset
+
+class TxInput(Mapping):
+    """
+    A read-only transaction input stored in fixed slots rather than a per-input dictionary.
+    Fields cannot be reassigned after construction, so records can be shared safely.
+    Supports read-only dictionary-style access (`tx_input["prev_txid"]`, `tx_input.get(...)`,
+    `in`, iteration over the keys) and compares equal to a dictionary with the same keys and values.
+    """
+    __slots__ = ('prev_txid', 'prev_vout', 'script_sig', 'sequence')
+
+    def __init__(self, prev_txid: str, prev_vout: int, script_sig: str, sequence: int = 0xFFFFFFFF):
+        # Fill the slots directly; our own __setattr__ refuses all writes.
+        set_field = object.__setattr__
+        set_field(self, 'prev_txid', prev_txid)
+        set_field(self, 'prev_vout', prev_vout)
+        set_field(self, 'script_sig', script_sig)
+        set_field(self, 'sequence', sequence)
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"TxInput is read-only; cannot set {name!r}")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"TxInput is read-only; cannot delete {name!r}")
+
+    @classmethod
+    def from_dict(cls, input_data: dict) -> 'TxInput':
+        """
+        Builds a TxInput from a dictionary with the same keys, as older code stored inputs.
+        A missing "sequence" defaults to 0xFFFFFFFF.
+        """
+        return cls(input_data['prev_txid'], input_data['prev_vout'], input_data['script_sig'],
+                   input_data.get('sequence', 0xFFFFFFFF))
+
+    def __getitem__(self, key: str):
+        if key in TxInput.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(TxInput.__slots__)
+
+    def __len__(self) -> int:
+        return len(TxInput.__slots__)
+
+    def __contains__(self, key) -> bool:
+        return key in TxInput.__slots__
+
+    def get(self, key: str, default=None):
+        """
+        Returns the field named `key`, or `default` if there is no such field.
+        """
+        if key in TxInput.__slots__:
+            return getattr(self, key)
+        return default
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TxInput):
+            return (self.prev_txid, self.prev_vout, self.script_sig, self.sequence) == \
+                   (other.prev_txid, other.prev_vout, other.script_sig, other.sequence)
+        if isinstance(other, dict):
+            return dict(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (f"TxInput(prev_txid={self.prev_txid!r}, prev_vout={self.prev_vout!r}, "
+                f"script_sig={self.script_sig!r}, sequence={self.sequence!r})")
 
 class TransactionData:
     """
     A class to represent and manage simplified Bitcoin transaction data.
     Illustrates lists, dictionaries, tuples, unpacking, and various loop constructs.
     """
-    def __init__(self, version: int = 1, lock_time: int = 0):
+    def __init__(self, version: int = 1, lock_time: int = 0, verbose: bool = True):
         self.version = version
-        self.inputs = []  # List of dictionaries, each representing a transaction input
-        self.outputs = [] # List of tuples, each representing a transaction output
+        self.inputs = []  # List of TxInput records, each representing a transaction input
+        self._output_values = [] # Output amounts in satoshis, one per output
+        self._output_scripts = [] # Output locking scripts, aligned with `_output_values`
+        self._outputs_view = None # Cached tuple of (value, script) pairs, rebuilt after changes
         self.lock_time = lock_time
         self.metadata = {} # Dictionary for arbitrary transaction metadata
+        self.verbose = verbose # Print progress messages; disable for bulk workloads
+
+    @property
+    def outputs(self) -> tuple[tuple, ...]:
+        """
+        The transaction outputs as a tuple of (value_satoshi, script_pubkey) tuples.
+        Outputs are stored as parallel value/script columns, so this is a read-only snapshot;
+        use `add_output` to add one.
+        """
+        if self._outputs_view is None:
+            self._outputs_view = tuple(zip(self._output_values, self._output_scripts))
+        return self._outputs_view
 
     def add_input(self, tx_id: str, vout_index: int, script_sig: str, sequence: int = 0xFFFFFFFF):
         """
-        Adds a new transaction input using list.append() and a dictionary.
+        Adds a new transaction input using list.append() and a TxInput record.
 
         Args:
             tx_id (str): The ID (hash) of the previous transaction.
@@ -122,62 +337,70 @@ class TransactionData:
             script_sig (str): The unlocking script.
             sequence (int): The sequence number.
         """
-        # Create a dictionary for the input and add to the `inputs` list.
-        input_data = {
-            'prev_txid': tx_id,
-            'prev_vout': vout_index,
-            'script_sig': script_sig,
-            'sequence': sequence
-        }
+        # Create a TxInput for the input and add to the `inputs` list. Ids and scripts recur
+        # across inputs, so intern str values to keep one shared copy of each; others
+        # (e.g. raw bytes) are stored as given.
+        input_data = TxInput(sys.intern(tx_id) if tx_id.__class__ is str else tx_id, vout_index,
+                             sys.intern(script_sig) if script_sig.__class__ is str else script_sig,
+                             sequence)
         self.inputs.append(input_data)
         # Add a print statement confirming the input was added.
-        print(f"Added input: {tx_id}:{vout_index}")
+        if self.verbose:
+            print(f"Added input: {tx_id}:{vout_index}")
 
     def add_output(self, value_satoshi: int, script_pubkey: str):
         """
-        Adds a new transaction output using list.append() and a tuple.
+        Adds a new transaction output by appending to the value and script columns.
 
         Args:
             value_satoshi (int): The amount in satoshis.
             script_pubkey (str): The locking script.
         """
-        # Create a tuple for the output and add to the `outputs` list.
-        output_data = (value_satoshi, script_pubkey)
-        self.outputs.append(output_data)
+        # Append the value and script (interned if it is a str) to their columns in lockstep.
+        self._output_values.append(value_satoshi)
+        self._output_scripts.append(sys.intern(script_pubkey) if script_pubkey.__class__ is str
+                                    else script_pubkey)
+        self._outputs_view = None
         # Add a print statement confirming the output was added.
-        print(f"Added output: {value_satoshi} satoshis")
+        if self.verbose:
+            print(f"Added output: {value_satoshi} satoshis")
 
-    def get_input_details(self) -> list[dict]:
+    def get_input_details(self) -> list['TxInput']:
         """
         Retrieves details of all transaction inputs.
         Demonstrates 'for' loop and 'enumerate'.
 
+        The returned list is new, but its TxInput records are the ones stored on the
+        transaction; treat them as read-only.
+
         Returns:
-            list[dict]: A list of input details.
+            list[TxInput]: A list of input details.
         """
+        inputs = self.inputs
+        verbose = self.verbose
+        if not verbose:
+            # Nothing to print, so copy the list of shared records in one C-level call.
+            return list(inputs)
+        
         detailed_inputs = []
         print("\n--- Input Details (using for and enumerate) ---")
-        # Iterate through `self.inputs` using a `for` loop with `enumerate` to get both index and input_data.
-        for index, input_data in enumerate(self.inputs):
-            # Inside the loop, print the input index.
-            print(f"Input {index}:")
-            # Use multiple assignment/dictionary unpacking to extract details from `input_data`.
-            prev_txid = input_data.get('prev_txid')
-            prev_vout = input_data.get('prev_vout')
-            script_sig = input_data.get('script_sig')
-            # Print these extracted details.
-            print(f"  Previous TXID: {prev_txid}")
-            print(f"  Previous VOUT: {prev_vout}")
-            print(f"  Script Sig: {script_sig}")
-            # Append a `copy` of the `input_data` dictionary to `detailed_inputs`.
-            detailed_inputs.append(input_data.copy())
+        # Iterate through `inputs` using a `for` loop with `enumerate` to get both index and input_data.
+        for index, input_data in enumerate(inputs):
+            # Print the input index and its details, read straight from the slots of `input_data`,
+            # with a single print call per input.
+            print(f"Input {index}:\n"
+                  f"  Previous TXID: {input_data.prev_txid}\n"
+                  f"  Previous VOUT: {input_data.prev_vout}\n"
+                  f"  Script Sig: {input_data.script_sig}")
+            # Append `input_data` itself; TxInput records are shared, not copied.
+            detailed_inputs.append(input_data)
         # Return `detailed_inputs`.
         return detailed_inputs
 
     def summarize_outputs(self, min_value: int = 0) -> tuple[int, int]:
         """
         Summarizes transaction outputs, skipping or breaking based on conditions.
-        Demonstrates 'while', 'continue', and 'break' loops.
+        Demonstrates 'for', 'continue', and 'break' loops.
 
         Args:
             min_value (int): Minimum satoshi value for an output to be included in sum.
@@ -185,25 +408,33 @@ class TransactionData:
         Returns:
             tuple[int, int]: Total satoshis in valid outputs and count of valid outputs.
         """
+        # Only the value column is needed; hoist it out of the loop.
+        values = self._output_values
+        threshold = 1000000000  # 1 billion satoshis
+        
+        if not self.verbose:
+            # Nothing to report per output, so skip the loop: keep the valid values, take
+            # running totals, and binary-search for the output that crosses the threshold.
+            valid_values = [value for value in values
+                            if isinstance(value, int) and value >= 0 and value >= min_value]
+            running_totals = list(accumulate(valid_values))
+            count = min(bisect_right(running_totals, threshold) + 1, len(running_totals))
+            return (running_totals[count - 1] if count else 0, count)
+        
         total_satoshi = 0
         valid_outputs_count = 0
-        index = 0
-        print("\n--- Summarizing Outputs (using while, continue, break) ---")
-        # Use a `while` loop that continues as long as `index` is less than `len(self.outputs)`.
-        while index < len(self.outputs):
-            # Inside the loop, unpack the current `value` and `script` from `self.outputs[index]` using tuple unpacking.
-            value, script = self.outputs[index]
+        print("\n--- Summarizing Outputs (using for, continue, break) ---")
+        # Use a `for` loop with `enumerate` over the output values.
+        for index, value in enumerate(values):
             # Implement a `continue` condition:
             # If `value` is not an integer or is negative, print a message and `continue` to the next iteration.
             if not isinstance(value, int) or value < 0:
                 print(f"Skipping invalid output at index {index}: {value}")
-                index += 1
                 continue
             # Implement another `continue` condition:
             # If `value` is less than `min_value`, print a message and `continue` to the next iteration.
             if value < min_value:
                 print(f"Skipping output at index {index}: {value} < {min_value}")
-                index += 1
                 continue
             # If the output is valid, add `value` to `total_satoshi` and increment `valid_outputs_count`.
             total_satoshi += value
@@ -212,11 +443,9 @@ class TransactionData:
             print(f"Including output {index}: {value} satoshis")
             # Implement a `break` condition:
             # If `total_satoshi` exceeds a certain threshold (e.g., 1,000,000,000 satoshis), print a message and `break` out of the loop.
-            if total_satoshi > 1000000000:  # 1 billion satoshis
+            if total_satoshi > threshold:
                 print(f"Total satoshis exceeded 1 Billion. Breaking summarization.")
                 break
-            # Increment `index` at the end of each iteration.
-            index += 1
         # Return `(total_satoshi, valid_outputs_count)` as a tuple.
         return (total_satoshi, valid_outputs_count)
 
@@ -230,7 +459,8 @@ class TransactionData:
         # Using dict.update() to merge new_data into metadata
         self.metadata.update(new_data)
         # Add a print statement showing the updated metadata.
-        print(f"Updated metadata: {self.metadata}")
+        if self.verbose:
+            print(f"Updated metadata: {self.metadata}")
 
     def get_metadata_value(self, key: str, default=None):
         """
@@ -245,7 +475,7 @@ class TransactionData:
         Demonstrates simple tuple creation and returning.
         """
         # Create and return a tuple containing `version`, `length of inputs`, `length of outputs`, and `lock_time`.
-        return (self.version, len(self.inputs), len(self.outputs), self.lock_time)
+        return (self.version, len(self.inputs), len(self._output_values), self.lock_time)
 
     def set_transaction_header(self, version: int, num_inputs: int, num_outputs: int, lock_time: int):
         """
@@ -257,7 +487,35 @@ class TransactionData:
         # Use multiple assignment to set `version`, and `lock_time`.
         self.version, _, _, self.lock_time = version, num_inputs, num_outputs, lock_time
         # Add a print statement confirming the attributes were set.
-        print(f"Set header via multiple assignment: version={self.version}, lock_time={self.lock_time}")
+        if self.verbose:
+            print(f"Set header via multiple assignment: version={self.version}, lock_time={self.lock_time}")
+
+class _UTXOView(Set):
+    """
+    A read-only, non-copying view of a UTXOSet's UTXO tuples.
+    Membership, iteration and size come straight from the underlying collection; set operators
+    (`|`, `&`, `-`, comparisons) return plain frozensets.
+    """
+    __slots__ = ('_utxos',)
+
+    def __init__(self, utxos):
+        self._utxos = utxos
+
+    @classmethod
+    def _from_iterable(cls, iterable) -> frozenset:
+        return frozenset(iterable)
+
+    def __contains__(self, utxo) -> bool:
+        return utxo in self._utxos
+
+    def __iter__(self):
+        return iter(self._utxos)
+
+    def __len__(self) -> int:
+        return len(self._utxos)
+
+    def __repr__(self) -> str:
+        return repr(set(self._utxos))
 
 class UTXOSet:
     """
@@ -265,20 +523,115 @@ class UTXOSet:
     Illustrates Python's `set` data structure and its methods.
 
     UTXOs are represented as tuples: (transaction_id_hex, vout_index, amount_satoshi).
+
+    Alongside the set, amounts are kept in a contiguous unsigned `array` column (with the matching
+    tuples in `_rows` at the same positions), so totals are summed in C. Adding appends to the
+    columns and removing moves the last row into the gap, so both are O(1); the columns are
+    sorted by amount only when a selection needs them in order, and stay sorted until the
+    next out-of-order change. The balance is kept as a running total.
+
+    Because the columns must stay in step with the set, `utxos` is a read-only view of it;
+    use add_utxo/remove_utxo, or assign a whole new collection to `utxos`.
     """
-    def __init__(self):
-        self.utxos = set() # Set to store unique UTXO tuples
+    def __init__(self, verbose: bool = True):
+        self._positions = {} # UTXO tuple -> index of its row in `_rows`/`_amounts`
+        self._utxos_view = _UTXOView(self._positions) # Read-only view of the UTXO tuples, without copying
+        self._rows = [] # UTXO tuples, positionally aligned with `_amounts`
+        self._amounts = array('Q') # Unsigned 64-bit amount column
+        self._sorted = True # Whether the columns are currently in ascending amount order
+        self._balance = 0 # Running total of `_amounts`
+        self.verbose = verbose # Print progress messages; disable for bulk workloads
+
+    @property
+    def utxos(self) -> _UTXOView:
+        """
+        The UTXO tuples in the set, as a read-only view that reflects later changes.
+        """
+        return self._utxos_view
+
+    @utxos.setter
+    def utxos(self, utxos):
+        # Replace the whole set, rebuilding the columns to match. Every tuple is checked and
+        # normalized as add_utxo would, before any state is touched.
+        self._load(list(dict.fromkeys(starmap(UTXOSet._utxo_tuple, utxos))), False)
+
+    @staticmethod
+    def _utxo_tuple(tx_id, vout_index: int, amount: int) -> tuple:
+        """
+        Builds a UTXO tuple, validating the amount and interning a str id.
+
+        Raises:
+            ValueError: If the amount is not an integer, is negative or exceeds u64 max.
+        """
+        # Amounts live in an unsigned 64-bit column, so reject anything that cannot be stored.
+        if amount.__class__ is not int and not isinstance(amount, int):
+            raise ValueError("UTXO amount must be a non-negative integer within u64")
+        if not 0 <= amount <= 18446744073709551615:
+            raise ValueError("UTXO amount must be a non-negative integer within u64")
+        # Interning a str id lets UTXOs from the same transaction share one string and
+        # compare by identity; other hashable ids (e.g. raw bytes) are stored as given.
+        if tx_id.__class__ is str:
+            tx_id = sys.intern(tx_id)
+        return (tx_id, vout_index, amount)
+
+    def _load(self, rows: list, is_sorted: bool):
+        """
+        Replaces the contents with a list of distinct UTXO tuples, noting whether they are
+        already in ascending amount order.
+        """
+        amounts = array('Q', map(itemgetter(2), rows))
+        positions = self._positions
+        positions.clear()
+        positions.update(zip(rows, range(len(rows))))
+        self._rows = rows
+        self._amounts = amounts
+        self._sorted = is_sorted
+        self._balance = sum(amounts)
+
+    def _sort_columns(self):
+        """
+        Sorts the columns by ascending amount, if a change has left them out of order.
+        """
+        if self._sorted:
+            return
+        rows = self._rows
+        rows.sort(key=itemgetter(2))
+        self._amounts = array('Q', map(itemgetter(2), rows))
+        self._positions.update(zip(rows, range(len(rows))))
+        self._sorted = True
+
+    @classmethod
+    def _from_rows(cls, rows: list, is_sorted: bool, verbose: bool = True) -> 'UTXOSet':
+        """
+        Builds a UTXOSet from a list of distinct UTXO tuples.
+        """
+        utxo_set = cls(verbose)
+        utxo_set._load(rows, is_sorted)
+        return utxo_set
 
     def add_utxo(self, tx_id: str, vout_index: int, amount: int):
         """
         Adds a UTXO to the set.
-        """
-        # Create a UTXO tuple using tx_id, vout_index, amount.
-        utxo_tuple = (tx_id, vout_index, amount)
-        # Add this tuple to the set.
-        self.utxos.add(utxo_tuple)
+
+        Raises:
+            ValueError: If the amount is not an integer, is negative or exceeds u64 max.
+        """
+        # Create a UTXO tuple using tx_id, vout_index, amount; invalid amounts are rejected
+        # before either column is touched.
+        utxo_tuple = UTXOSet._utxo_tuple(tx_id, vout_index, amount)
+        # Add this tuple to the set, appending it to the columns if it is new.
+        positions = self._positions
+        if utxo_tuple not in positions:
+            amounts = self._amounts
+            if self._sorted and amounts and amount < amounts[-1]:
+                self._sorted = False
+            positions[utxo_tuple] = len(amounts)
+            amounts.append(amount)
+            self._rows.append(utxo_tuple)
+            self._balance += amount
         # Add a print statement confirming the UTXO was added.
-        print(f"Added UTXO: {tx_id}:{vout_index} - {amount} satoshis")
+        if self.verbose:
+            print(f"Added UTXO: {tx_id}:{vout_index} - {amount} satoshis")
 
     def remove_utxo(self, tx_id: str, vout_index: int, amount: int) -> bool:
         """
@@ -289,25 +642,39 @@ class UTXOSet:
         """
         # Create and remove the UTXO tuple from the set.
         utxo_tuple = (tx_id, vout_index, amount)
-        if utxo_tuple in self.utxos:
-            self.utxos.remove(utxo_tuple)
-            return True
-        return False
+        position = self._positions.pop(utxo_tuple, None)
+        if position is None:
+            if self.verbose:
+                print(f"UTXO not found: {tx_id}:{vout_index}")
+            return False
+        # Drop the last row from both columns and, unless it is the one being removed,
+        # move it into the removed row's place.
+        rows = self._rows
+        amounts = self._amounts
+        last_row = rows.pop()
+        last_amount = amounts.pop()
+        if position < len(rows):
+            rows[position] = last_row
+            amounts[position] = last_amount
+            self._positions[last_row] = position
+            self._sorted = False
+        self._balance -= amount
+        if self.verbose:
+            print(f"Removed UTXO: {tx_id}:{vout_index}")
+        return True
 
     def get_balance(self) -> int:
         """
         Calculates the total balance from all UTXOs in the set.
         """
-        # Iterate through the utxos and return the total
-        total = 0
-        for tx_id, vout_index, amount in self.utxos:
-            total += amount
-        return total
+        # The total is kept up to date by add_utxo/remove_utxo.
+        return self._balance
 
     def find_sufficient_utxos(self, target_amount: int) -> set:
         """
         Finds a subset of UTXOs that sum up to at least the target amount.
         Demonstrates set operations (creating a new set).
+        UTXOs are picked largest first, so the selection uses as few of them as possible.
 
         Args:
             target_amount (int): The amount needed.
@@ -315,22 +682,22 @@ class UTXOSet:
         Returns:
             set: A set of UTXOs that fulfill the amount, or empty set if not possible.
         """
-        # Return set of UTXOs that fulfill the target_amount, or empty set if not possible.
-        selected_utxos = set()
-        current_amount = 0
-        
-        for utxo in self.utxos:
-            tx_id, vout_index, amount = utxo
-            selected_utxos.add(utxo)
-            current_amount += amount
-            if current_amount >= target_amount:
-                print(f"Found sufficient UTXOs for target amount {target_amount}")
-                return selected_utxos
+        # Walk the sorted amount column from the largest end, stopping as soon as the
+        # running total reaches the target; only the selected rows are touched.
+        self._sort_columns()
+        rows = self._rows
+        size = len(rows)
+        if size and self._balance >= target_amount:
+            for count, total in enumerate(accumulate(reversed(self._amounts)), 1):
+                if total >= target_amount:
+                    if self.verbose:
+                        print(f"Found sufficient UTXOs for target amount {target_amount}")
+                    return set(rows[size - count:])
         
         # If we can't reach the target amount, return empty set
-        if current_amount < target_amount:
-            return set()
-        return selected_utxos
+        if self.verbose:
+            print(f"Could not find sufficient UTXOs for target amount {target_amount}")
+        return set()
 
     def get_total_utxo_count(self) -> int:
         """
@@ -338,7 +705,7 @@ class UTXOSet:
         Demonstrates `len()` on a set.
         """
         # Return the length of the utxos set
-        return len(self.utxos)
+        return len(self._positions)
 
     def is_subset_of(self, other_utxo_set: 'UTXOSet') -> bool:
         """
@@ -346,84 +713,170 @@ class UTXOSet:
         Demonstrates set.issubset().
         """
         # Check if is subset and return the result.
-        return self.utxos.issubset(other_utxo_set.utxos)
+        return self._positions.keys() <= other_utxo_set._positions.keys()
 
     def combine_utxos(self, other_utxo_set: 'UTXOSet') -> 'UTXOSet':
         """
         Combines two UTXO sets
         """
+        # Take this set's rows plus the other set's rows it does not already have; the
+        # combined columns are sorted the first time a selection needs them in order.
+        positions = self._positions
+        extra_rows = [utxo for utxo in other_utxo_set._rows if utxo not in positions]
+        combined_set = UTXOSet._from_rows(self._rows + extra_rows, False, self.verbose)
         # Return `combined_set`.
-        combined_set = UTXOSet()
-        combined_set.utxos = self.utxos.union(other_utxo_set.utxos)
         return combined_set
 
     def find_common_utxos(self, other_utxo_set: 'UTXOSet') -> 'UTXOSet':
         """
-        Finds UTXOs common to two sets using set.intersection().
+        Finds UTXOs common to two sets using set intersection (`&`).
         """
-        # Get the intersection of the two sets and Return the common_set
-        common_set = UTXOSet()
-        common_set.utxos = self.utxos.intersection(other_utxo_set.utxos)
+        # Keep the smaller set's rows that the larger set also holds; filtering preserves
+        # their order, so rows that were sorted stay sorted.
+        smaller, larger = sorted((self, other_utxo_set), key=lambda utxo_set: len(utxo_set._positions))
+        larger_positions = larger._positions
+        rows = [utxo for utxo in smaller._rows if utxo in larger_positions]
+        common_set = UTXOSet._from_rows(rows, smaller._sorted, self.verbose)
+        # Return the common_set
         return common_set
 
-def generate_block_headers(
+def generate_block_hashes(
     prev_block_hash: str,
     merkle_root: str,
     timestamp: int,
     bits: int,
     start_nonce: int = 0,
-    max_attempts: int = 1000
+    max_attempts: int = 1000,
+    verbose: bool = True
 ):
     """
-    A generator function that simulates generating block headers by incrementing the nonce.
-    This demonstrates the concept of proof-of-work attempts.
+    A generator function that tries successive nonces and yields each one with its header hash.
+    Lighter than `generate_block_headers` when only the nonce and hash are needed,
+    since no header dictionary is built per attempt.
 
     Args:
-        prev_block_hash (str): The hash of the previous block.
-        merkle_root (str): The Merkle root of the transactions.
+        prev_block_hash (str): The hash of the previous block, as hex.
+        merkle_root (str): The Merkle root of the transactions, as hex.
         timestamp (int): The block timestamp.
         bits (int): The target difficulty in compact form.
         start_nonce (int): The starting nonce.
         max_attempts (int): Maximum number of nonces to try.
+        verbose (bool): Print the first, every 100th and the last attempt, plus periodic progress.
 
     Yields:
-        dict: A dictionary representing a potential block header, including the current nonce.
+        tuple[int, bytes]: The current nonce and the double SHA-256 digest of the 80-byte header,
+                           in internal (little-endian) byte order.
+
+    Raises:
+        ValueError: If either hash is not 32 bytes of hex, or the timestamp, bits or
+                    nonces to try do not all fit in 4 unsigned bytes.
     """
-    print(f"\n--- Generating Block Headers (using generator) ---")
+    # Validate everything before the first attempt, so a bad input cannot hash a header that
+    # differs from it or fail partway through the sweep.
+    prev_hash_bytes = bytes.fromhex(prev_block_hash)[::-1]
+    merkle_root_bytes = bytes.fromhex(merkle_root)[::-1]
+    if len(prev_hash_bytes) != 32:
+        raise ValueError("prev_block_hash must be 32 bytes of hex")
+    if len(merkle_root_bytes) != 32:
+        raise ValueError("merkle_root must be 32 bytes of hex")
+    if not 0 <= timestamp <= 0xFFFFFFFF:
+        raise ValueError("timestamp must fit in 4 unsigned bytes (0 to 4294967295)")
+    if not 0 <= bits <= 0xFFFFFFFF:
+        raise ValueError("bits must fit in 4 unsigned bytes (0 to 4294967295)")
+    if start_nonce < 0 or (max_attempts > 0 and start_nonce + max_attempts - 1 > 0xFFFFFFFF):
+        raise ValueError("Nonces must fit in 4 unsigned bytes (0 to 4294967295)")
+    
+    if verbose:
+        print(f"\n--- Generating Block Headers (using generator) ---")
     nonce = start_nonce
     attempts = 0
     
+    # The first 76 bytes of the 80-byte header (version, prev hash, merkle root, timestamp, bits)
+    # never change between attempts, so serialize them once. Hashes are stored byte-reversed.
+    header_prefix = _HEADER_PREFIX.pack(1, prev_hash_bytes, merkle_root_bytes, timestamp, bits)
+    # Feed the prefix to SHA-256 once; copying this midstate is far cheaper than re-hashing it.
+    midstate = hashlib.sha256(header_prefix)
+    # Bind the per-attempt callables to locals so the loop body skips attribute lookups,
+    # and reuse one 4-byte buffer for the nonce instead of allocating bytes per attempt.
+    copy_midstate = midstate.copy
+    sha256 = hashlib.sha256
+    pack_nonce_into = _PACK_NONCE_INTO
+    nonce_bytes = bytearray(4)
+    
     # Use a `while` loop that continues as long as `attempts < max_attempts`.
     while attempts < max_attempts:
-        # Inside the loop, create a dictionary `header_data` with keys like "version",
-        # "prev_block_hash", "merkle_root", "timestamp", "bits", and the current "nonce".
-        header_data = {
-            "version": 1,
-            "prev_block_hash": prev_block_hash,
-            "merkle_root": merkle_root,
-            "timestamp": timestamp,
-            "bits": bits,
-            "nonce": nonce
-        }
+        # Hash the binary 80-byte header: clone the prefix midstate and feed only the nonce,
+        # then hash that digest again (Bitcoin's double SHA-256). Stay in raw bytes throughout.
+        pack_nonce_into(nonce_bytes, 0, nonce)
+        header_hash = copy_midstate()
+        header_hash.update(nonce_bytes)
+        simulated_hash = sha256(header_hash.digest()).digest()
         
-        # Simulate a hash calculation (e.g., using `hashlib.sha256` on a string representation of `header_data`).
-        header_str = str(header_data)
-        simulated_hash = hashlib.sha256(header_str.encode()).hexdigest()
+        # Print the current attempt, nonce, and simulated hash prefix for the first attempt,
+        # every 100th attempt, and the last one. Only these 4 bytes are hex-encoded, most
+        # significant first as block hashes are usually displayed.
+        if verbose and (attempts == 0 or (attempts + 1) % 100 == 0 or attempts + 1 == max_attempts):
+            print(f"Attempt {attempts + 1}: Nonce {nonce}, Hash: {simulated_hash[:-5:-1].hex()}...")
         
-        # Print the current attempt, nonce, and simulated hash prefix.
-        print(f"Attempt {attempts + 1}: Nonce {nonce}, Hash: {simulated_hash[:8]}...")
-        
-        # Use `yield header_data` to return the current header without exiting the function.
-        yield header_data
+        # Use `yield` to return the current nonce and hash without exiting the function.
+        yield nonce, simulated_hash
         
         # Increment `nonce` and `attempts`.
         nonce += 1
         attempts += 1
         
         # Add a conditional print statement (e.g., every 100 attempts) to show progress.
-        if attempts % 100 == 0 and attempts > 0:
+        if verbose and attempts % 100 == 0 and attempts > 0:
             print(f"... {attempts} attempts made ...")
 
+def generate_block_headers(
+    prev_block_hash: str,
+    merkle_root: str,
+    timestamp: int,
+    bits: int,
+    start_nonce: int = 0,
+    max_attempts: int = 1000,
+    verbose: bool = True
+):
+    """
+    A generator function that simulates generating block headers by incrementing the nonce.
+    This demonstrates the concept of proof-of-work attempts.
+    Wraps `generate_block_hashes`, building a header dictionary for each attempt.
+
+    Args:
+        prev_block_hash (str): The hash of the previous block, as hex.
+        merkle_root (str): The Merkle root of the transactions, as hex.
+        timestamp (int): The block timestamp.
+        bits (int): The target difficulty in compact form.
+        start_nonce (int): The starting nonce.
+        max_attempts (int): Maximum number of nonces to try.
+        verbose (bool): Print the first, every 100th and the last attempt, plus periodic progress.
+
+    Yields:
+        dict: A dictionary representing a potential block header, including the current nonce.
+
+    Raises:
+        ValueError: As for `generate_block_hashes`.
+    """
+    # Build the fields shared by every header once, with keys like "version",
+    # "prev_block_hash", "merkle_root", "timestamp", "bits", and a placeholder "nonce".
+    header_template = {
+        "version": 1,
+        "prev_block_hash": prev_block_hash,
+        "merkle_root": merkle_root,
+        "timestamp": timestamp,
+        "bits": bits,
+        "nonce": start_nonce
+    }
+    copy_template = header_template.copy
+    for nonce, _ in generate_block_hashes(prev_block_hash, merkle_root, timestamp, bits,
+                                          start_nonce, max_attempts, verbose):
+        # Each attempt gets its own dictionary `header_data`: copying the template is much
+        # cheaper than building six keys, and callers may keep earlier headers around.
+        header_data = copy_template()
+        header_data["nonce"] = nonce
+        yield header_data
+
 # Example usage and testing
 if __name__ == "__main__":
     # Test CompactSize encoder/decoder
@@ -491,7 +944,7 @@ if __name__ == "__main__":
     print("\n=== Testing Block Header Generator ===")
     header_gen = generate_block_headers(
         prev_block_hash="0000000000000000000000000000000000000000000000000000000000000000",
-        merkle_root="abc123def456",
+        merkle_root="4a5e1e4baab89f3a32518a88c31bc87f618f76673e2cc77ab2127b7afdeda33b",
         timestamp=1640995200,
         bits=0x1d00ffff,
         start_nonce=0,
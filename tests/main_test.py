@@ -58,6 +58,21 @@ class TestCompactSize(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "Data is too short"):
             self.decoder.decode(b'')
 
+    def test_decode_single_byte_results_are_shared(self):
+        self.assertIs(self.decoder.decode(b'\x2a'), self.decoder.decode(b'\x00\x2a', 1))
+        self.assertEqual(self.decoder.decode(b'\xfc'), (252, 1))
+
+    def test_decode_at_offset(self):
+        data = b'\x05' + self.encoder.encode(65537) + b'\x07'
+        self.assertEqual(self.decoder.decode(data, 1), (65537, 5))
+        self.assertEqual(self.decoder.decode(memoryview(data), 6), (7, 1))
+        with self.assertRaisesRegex(ValueError, "Data is too short"):
+            self.decoder.decode(data, 7)
+        with self.assertRaisesRegex(ValueError, "Data too short"):
+            self.decoder.decode(data[:5], 1)
+        with self.assertRaisesRegex(ValueError, "non-negative"):
+            self.decoder.decode(b'\x05\x07', -1)
+
     def test_encode_invalid_input(self):
         with self.assertRaises(ValueError):
             self.encoder.encode(-1)
@@ -65,6 +80,67 @@ class TestCompactSize(unittest.TestCase):
             self.encoder.encode(0xFFFFFFFFFFFFFFFF + 1) # Too large
         with self.assertRaises(ValueError):
             self.encoder.encode("not an int")
+        with self.assertRaisesRegex(ValueError, "non-negative"):
+            self.encoder.encode(-(1 << 70))
+        with self.assertRaisesRegex(ValueError, "u64 maximum"):
+            self.encoder.encode(1 << 64)
+        with self.assertRaises(ValueError):
+            self.encoder.encode(1.0)
+        self.assertEqual(self.encoder.encode(True), b'\x01')
+
+    def test_encode_small_values_are_shared(self):
+        self.assertIs(self.encoder.encode(42), self.encoder.encode(42))
+        self.assertIs(self.encoder.encode(252), self.encoder.encode_trusted(252))
+
+    def test_encode_trusted_matches_encode(self):
+        for val in [0, 252, 253, 65535, 65536, 4294967295, 4294967296, 0xFFFFFFFFFFFFFFFF]:
+            self.assertEqual(self.encoder.encode_trusted(val), self.encoder.encode(val))
+
+    def test_encode_many_matches_encode(self):
+        values = [0, 252, 253, 65535, 65536, 4294967295, 4294967296, 0xFFFFFFFFFFFFFFFF]
+        encoded = self.encoder.encode_many(values)
+        self.assertEqual(encoded, b''.join(self.encoder.encode(v) for v in values))
+        self.assertEqual(self.encoder.encode_many([]), b'')
+        with self.assertRaises(ValueError):
+            self.encoder.encode_many([1, -1])
+        with self.assertRaises(ValueError):
+            self.encoder.encode_many([0xFFFFFFFFFFFFFFFF + 1])
+        with self.assertRaises(ValueError):
+            self.encoder.encode_many([1, "2"])
+
+    def test_encode_many_accepts_iterators(self):
+        values = [1, 300, 2, 4294967296]
+        expected = b''.join(self.encoder.encode(v) for v in values)
+        self.assertEqual(self.encoder.encode_many(iter(values)), expected)
+        self.assertEqual(self.encoder.encode_many(v for v in values), expected)
+        self.assertEqual(self.encoder.encode_many(v for v in [1, 2, 3]), b'\x01\x02\x03')
+
+    def test_encode_many_rejects_index_objects(self):
+        class Index:
+            def __index__(self):
+                return 5
+        with self.assertRaises(ValueError):
+            self.encoder.encode(Index())
+        with self.assertRaises(ValueError):
+            self.encoder.encode_many([Index()])
+
+    def test_decode_many(self):
+        values = [7, 253, 70000, 4294967296]
+        encoded = self.encoder.encode_many(values) + b'\x2a'
+        decoded, consumed = self.decoder.decode_many(encoded, len(values))
+        self.assertEqual(decoded, values)
+        self.assertEqual(consumed, len(encoded) - 1)
+        small = list(range(0xFD)) * 3
+        encoded_small = self.encoder.encode_many(small)
+        self.assertEqual(encoded_small, bytes(small))
+        self.assertEqual(self.decoder.decode_many(encoded_small + b'\xfd', len(small)), (small, len(small)))
+        mixed = [1, 2, 300, 3, 4, 0xFFFFFFFFFF, 5]
+        self.assertEqual(self.decoder.decode_many(bytearray(self.encoder.encode_many(mixed)), len(mixed))[0], mixed)
+        self.assertEqual(self.decoder.decode_many(b'', 0), ([], 0))
+        with self.assertRaisesRegex(ValueError, "Data too short"):
+            self.decoder.decode_many(b'\x01\xfd\x01', 2)
+        with self.assertRaisesRegex(ValueError, "Data is too short"):
+            self.decoder.decode_many(b'\x01', 2)
 
 class TestTransactionData(unittest.TestCase):
     def setUp(self):
@@ -99,10 +175,70 @@ class TestTransactionData(unittest.TestCase):
         self.tx.add_input(self.txid_1, 1, self.script_sig_1, sequence=123)
         self.assertEqual(self.tx.inputs[1]["sequence"], 123)
 
+    def test_tx_input_mapping_access(self):
+        tx_input = TxInput(self.txid_0, 2, self.script_sig_0)
+        self.assertEqual(tx_input["prev_vout"], 2)
+        self.assertEqual(tx_input.get("sequence"), 0xFFFFFFFF)
+        self.assertIsNone(tx_input.get("missing"))
+        with self.assertRaises(KeyError):
+            tx_input["missing"]
+        self.assertEqual(dict(tx_input), {
+            "prev_txid": self.txid_0,
+            "prev_vout": 2,
+            "script_sig": self.script_sig_0,
+            "sequence": 0xFFFFFFFF
+        })
+        self.assertIn("prev_txid", tx_input)
+        self.assertNotIn("missing", tx_input)
+        self.assertNotIn(0, tx_input)
+        self.assertEqual(list(tx_input), ["prev_txid", "prev_vout", "script_sig", "sequence"])
+        self.assertEqual(len(tx_input), 4)
+        self.assertFalse(hasattr(tx_input, "__dict__"))
+        with self.assertRaises(AttributeError):
+            tx_input.prev_txid = self.txid_1
+        with self.assertRaises(AttributeError):
+            del tx_input.sequence
+        self.assertEqual(tx_input.prev_txid, self.txid_0)
+        self.assertEqual(TxInput.from_dict(dict(tx_input)), tx_input)
+        self.assertEqual(TxInput.from_dict({"prev_txid": self.txid_1, "prev_vout": 0, "script_sig": ""}).sequence, 0xFFFFFFFF)
+
+    def test_quiet_mode_prints_nothing(self):
+        tx = TransactionData(verbose=False)
+        tx.add_input(self.txid_0, 0, self.script_sig_0)
+        tx.add_output(1000, self.script_pubkey_0)
+        details = tx.get_input_details()
+        self.assertEqual(details, tx.inputs)
+        self.assertIsNot(details, tx.inputs)
+        self.assertIs(details[0], tx.inputs[0])
+        self.assertEqual(tx.summarize_outputs(), (1000, 1))
+        self.assertEqual(self.new_stdout.getvalue(), "")
+
+    def test_repeated_scripts_are_shared(self):
+        self.tx.add_output(1000, "".join(["script_", "pubkey"]))
+        self.tx.add_output(2000, "".join(["script_", "pubkey"]))
+        self.assertIs(self.tx.outputs[0][1], self.tx.outputs[1][1])
+        self.tx.add_input("".join(["ab", "cd"]), 0, "".join(["sig", "1"]))
+        self.tx.add_input("".join(["ab", "cd"]), 1, "".join(["sig", "1"]))
+        self.assertIs(self.tx.inputs[0].prev_txid, self.tx.inputs[1].prev_txid)
+        self.assertIs(self.tx.inputs[0].script_sig, self.tx.inputs[1].script_sig)
+
+    def test_bytes_ids_and_scripts(self):
+        self.tx.add_input(b"\x01" * 32, 0, b"\x51")
+        self.tx.add_output(1000, b"\x76\xa9")
+        self.assertEqual(self.tx.inputs[0]["prev_txid"], b"\x01" * 32)
+        self.assertEqual(self.tx.inputs[0]["script_sig"], b"\x51")
+        self.assertEqual(self.tx.outputs[0], (1000, b"\x76\xa9"))
+
     def test_add_output(self):
         self.tx.add_output(100000, self.script_pubkey_0)
         self.assertEqual(len(self.tx.outputs), 1)
         self.assertEqual(self.tx.outputs[0], (100000, self.script_pubkey_0))
+        with self.assertRaises(AttributeError):
+            self.tx.outputs.append((5000, self.script_pubkey_0))
+        self.assertEqual(len(self.tx.outputs), 1)
+        self.assertIs(self.tx.outputs, self.tx.outputs)
+        self.tx.add_output(5000, self.script_pubkey_0)
+        self.assertEqual(self.tx.outputs[1], (5000, self.script_pubkey_0))
 
     def test_get_input_details(self):
         self.tx.add_input(self.txid_0, 0, self.script_sig_0)
@@ -110,6 +246,9 @@ class TestTransactionData(unittest.TestCase):
         details = self.tx.get_input_details()
         self.assertEqual(len(details), 2)
         self.assertEqual(details[0]["prev_txid"], self.txid_0)
+        self.assertIs(details[1], self.tx.inputs[1])
+        details.pop()
+        self.assertEqual(len(self.tx.inputs), 2)
         self.assertIn("--- Input Details", self.new_stdout.getvalue())
 
     def test_summarize_outputs_normal(self):
@@ -141,6 +280,23 @@ class TestTransactionData(unittest.TestCase):
         self.assertIn("Total satoshis exceeded 1 Billion. Breaking summarization.", self.new_stdout.getvalue())
         self.assertNotIn("Skipping output 2", self.new_stdout.getvalue()) # Verify last output was not processed
 
+    def test_summarize_outputs_quiet_matches_verbose(self):
+        cases = [
+            [50000, 30000],
+            [10000, 500, 20000, -100, 2.5],
+            [100000000, 950000000, 50000],
+            [1000000000, 1, 1],
+            [],
+        ]
+        for values in cases:
+            loud = TransactionData()
+            quiet = TransactionData(verbose=False)
+            for value in values:
+                loud.add_output(value, self.script_pubkey_0)
+                quiet.add_output(value, self.script_pubkey_0)
+            for min_value in (0, 1000):
+                self.assertEqual(quiet.summarize_outputs(min_value), loud.summarize_outputs(min_value))
+
     def test_update_metadata(self):
         self.tx.update_metadata({"fee": 100, "memo": "test"})
         self.assertEqual(self.tx.metadata, {"fee": 100, "memo": "test"})
@@ -194,6 +350,25 @@ class TestUTXOSet(unittest.TestCase):
         self.utxo_set.add_utxo(*self.utxo1)
         self.assertEqual(self.utxo_set.get_total_utxo_count(), 1) # Still 1
 
+    def test_add_utxo_rejects_invalid_amount(self):
+        with self.assertRaises(ValueError):
+            self.utxo_set.add_utxo("tx_bad", 0, -1)
+        with self.assertRaises(ValueError):
+            self.utxo_set.add_utxo("tx_bad", 0, 1 << 64)
+        with self.assertRaises(ValueError):
+            self.utxo_set.add_utxo("tx_bad", 0, 50.5)
+        self.assertEqual(self.utxo_set.get_total_utxo_count(), 0)
+        self.assertEqual(self.utxo_set.get_balance(), 0)
+        # The columns stay aligned, so later removals still work.
+        self.utxo_set.add_utxo(*self.utxo1)
+        self.assertTrue(self.utxo_set.remove_utxo(*self.utxo1))
+
+    def test_add_utxo_accepts_bytes_id(self):
+        tx_id = b"\x01" * 32
+        self.utxo_set.add_utxo(tx_id, 0, 5)
+        self.assertIn((tx_id, 0, 5), self.utxo_set.utxos)
+        self.assertTrue(self.utxo_set.remove_utxo(tx_id, 0, 5))
+
     def test_remove_utxo(self):
         self.utxo_set.add_utxo(*self.utxo1)
         self.assertTrue(self.utxo_set.remove_utxo(*self.utxo1))
@@ -203,11 +378,59 @@ class TestUTXOSet(unittest.TestCase):
         self.assertIn("UTXO not found", self.new_stdout.getvalue())
 
 
+    def test_utxos_cannot_drift_from_columns(self):
+        self.utxo_set.add_utxo(*self.utxo1)
+        with self.assertRaises(AttributeError):
+            self.utxo_set.utxos.add(self.utxo2)
+        view = self.utxo_set.utxos
+        self.utxo_set.add_utxo(*self.utxo3)
+        self.assertIn(self.utxo3, view)
+        self.assertEqual(view | {self.utxo2}, {self.utxo1, self.utxo2, self.utxo3})
+        self.assertTrue(self.utxo_set.remove_utxo(*self.utxo3))
+        for bad_amount in (50.5, -1, 1 << 64):
+            with self.assertRaises(ValueError):
+                self.utxo_set.utxos = [self.utxo2, ("tx_bad", 0, bad_amount)]
+        self.assertEqual(self.utxo_set.utxos, {self.utxo1})
+        self.utxo_set.utxos = [("".join(["tx2", "_id"]), 1, 20000), self.utxo1, self.utxo2]
+        self.assertIs(next(utxo for utxo in self.utxo_set.utxos if utxo[2] == 20000)[0], sys.intern("tx2_id"))
+        self.assertEqual(self.utxo_set.utxos, {self.utxo1, self.utxo2})
+        self.assertEqual(self.utxo_set.get_balance(), 30000)
+        self.assertEqual(self.utxo_set.find_sufficient_utxos(25000), {self.utxo1, self.utxo2})
+        self.assertTrue(self.utxo_set.remove_utxo(*self.utxo2))
+        self.assertEqual(self.utxo_set.utxos, {self.utxo1})
+        self.assertEqual(self.utxo_set.get_balance(), 10000)
+
     def test_get_balance(self):
         self.utxo_set.add_utxo(*self.utxo1) # 10000
         self.utxo_set.add_utxo(*self.utxo2) # 20000
         self.assertEqual(self.utxo_set.get_balance(), 30000)
 
+    def test_balance_after_remove(self):
+        self.utxo_set.add_utxo(*self.utxo1)
+        self.utxo_set.add_utxo(*self.utxo2)
+        self.utxo_set.add_utxo(*self.utxo3)
+        self.utxo_set.add_utxo(*self.utxo1) # Duplicate must not be counted twice
+        self.assertTrue(self.utxo_set.remove_utxo(*self.utxo1))
+        self.assertEqual(self.utxo_set.get_balance(), 25000)
+        self.assertTrue(self.utxo_set.remove_utxo(*self.utxo3))
+        self.assertEqual(self.utxo_set.get_balance(), 20000)
+
+    def test_combined_balance(self):
+        self.utxo_set.add_utxo(*self.utxo1)
+        self.utxo_set.add_utxo(*self.utxo2)
+        other_set = UTXOSet()
+        other_set.add_utxo(*self.utxo2)
+        other_set.add_utxo(*self.utxo3)
+        self.assertEqual(self.utxo_set.combine_utxos(other_set).get_balance(), 35000)
+        self.assertEqual(self.utxo_set.find_common_utxos(other_set).get_balance(), 20000)
+
+    def test_quiet_mode_prints_nothing(self):
+        utxo_set = UTXOSet(verbose=False)
+        utxo_set.add_utxo(*self.utxo1)
+        utxo_set.remove_utxo(*self.utxo2)
+        utxo_set.find_sufficient_utxos(5000)
+        self.assertEqual(self.new_stdout.getvalue(), "")
+
     def test_find_sufficient_utxos(self):
         self.utxo_set.add_utxo(*self.utxo1) # 10000
         self.utxo_set.add_utxo(*self.utxo2) # 20000
@@ -224,6 +447,36 @@ class TestUTXOSet(unittest.TestCase):
         self.assertIn("Could not find sufficient UTXOs", self.new_stdout.getvalue())
 
 
+    def test_find_sufficient_utxos_prefers_largest(self):
+        self.utxo_set.add_utxo(*self.utxo1) # 10000
+        self.utxo_set.add_utxo(*self.utxo2) # 20000
+        self.utxo_set.add_utxo(*self.utxo3) # 5000
+        self.assertEqual(self.utxo_set.find_sufficient_utxos(15000), {self.utxo2})
+        self.assertEqual(self.utxo_set.find_sufficient_utxos(30000), {self.utxo1, self.utxo2})
+        self.utxo_set.remove_utxo(*self.utxo2)
+        self.assertEqual(self.utxo_set.find_sufficient_utxos(15000), {self.utxo1, self.utxo3})
+        self.assertEqual(UTXOSet(verbose=False).find_sufficient_utxos(0), set())
+
+    def test_columns_stay_consistent_through_changes(self):
+        utxo_set = UTXOSet(verbose=False)
+        expected = set()
+        for i in range(200):
+            utxo = (f"tx{i % 7}", i, (i * 7919) % 1000)
+            utxo_set.add_utxo(*utxo)
+            expected.add(utxo)
+            if i % 3 == 0:
+                removed = (f"tx{(i // 2) % 7}", i // 2, ((i // 2) * 7919) % 1000)
+                self.assertEqual(utxo_set.remove_utxo(*removed), removed in expected)
+                expected.discard(removed)
+        self.assertEqual(utxo_set.utxos, expected)
+        self.assertEqual(utxo_set.get_balance(), sum(amount for _, _, amount in expected))
+        largest = sorted(expected, key=lambda utxo: utxo[2])[-3:]
+        target = sum(amount for _, _, amount in largest)
+        self.assertEqual(utxo_set.find_sufficient_utxos(target), set(largest))
+        utxo_set.add_utxo("tx_small", 0, 0)
+        self.assertIn(("tx_small", 0, 0), utxo_set.utxos)
+        self.assertEqual(utxo_set.find_sufficient_utxos(target), set(largest))
+
     def test_get_total_utxo_count(self):
         self.assertEqual(self.utxo_set.get_total_utxo_count(), 0)
         self.utxo_set.add_utxo(*self.utxo1)
@@ -327,6 +580,59 @@ class TestBlockHeaderGenerator(unittest.TestCase):
         self.assertIn("Attempt 1:", output)
         self.assertIn("... 100 attempts made ...", output)
         self.assertIn("Attempt 101:", output)
+        self.assertIn("Attempt 100:", output)
+        self.assertNotIn("Attempt 2:", output)
+        self.assertNotIn("Attempt 50:", output)
+
+    def test_hash_generator_yields_nonce_and_digest(self):
+        gen = generate_block_hashes(self.prev_hash, self.merkle_root, self.timestamp, self.bits, start_nonce=7, max_attempts=2)
+        results = list(gen)
+        self.assertEqual([nonce for nonce, _ in results], [7, 8])
+        header = (
+            (1).to_bytes(4, 'little')
+            + bytes.fromhex(self.prev_hash)[::-1]
+            + bytes.fromhex(self.merkle_root)[::-1]
+            + self.timestamp.to_bytes(4, 'little')
+            + self.bits.to_bytes(4, 'little')
+            + (7).to_bytes(4, 'little')
+        )
+        self.assertEqual(results[0][1], hashlib.sha256(hashlib.sha256(header).digest()).digest())
+
+    def test_hash_generator_genesis_block(self):
+        gen = generate_block_hashes(
+            "00" * 32,
+            "4a5e1e4baab89f3a32518a88c31bc87f618f76673e2cc77ab2127b7afdeda33b",
+            1231006505,
+            0x1d00ffff,
+            start_nonce=2083236893,
+            max_attempts=1
+        )
+        nonce, digest = next(gen)
+        self.assertEqual(nonce, 2083236893)
+        self.assertEqual(digest[::-1].hex(), "000000000019d6689c085ae165831e934ff763ae46a2a6c172b3f1b60a8ce26f")
+        self.assertIn("Hash: 00000000...", self.new_stdout.getvalue())
+
+    def test_hash_generator_rejects_bad_input(self):
+        for prev_hash, merkle_root in (("00" * 40, self.merkle_root), (self.prev_hash, "abc123def456")):
+            with self.assertRaises(ValueError):
+                next(generate_block_hashes(prev_hash, merkle_root, self.timestamp, self.bits))
+        with self.assertRaises(ValueError):
+            next(generate_block_hashes(self.prev_hash, self.merkle_root, self.timestamp, self.bits,
+                                       start_nonce=2**32 - 1, max_attempts=2))
+        with self.assertRaises(ValueError):
+            next(generate_block_headers(self.prev_hash, self.merkle_root, self.timestamp, self.bits, start_nonce=-1))
+        for timestamp, bits in ((1678886400000, self.bits), (-1, self.bits), (self.timestamp, -1), (self.timestamp, 1 << 32)):
+            with self.assertRaises(ValueError):
+                next(generate_block_hashes(self.prev_hash, self.merkle_root, timestamp, bits))
+        last = list(generate_block_hashes(self.prev_hash, self.merkle_root, self.timestamp, self.bits,
+                                          start_nonce=2**32 - 1, max_attempts=1))
+        self.assertEqual(last[0][0], 2**32 - 1)
+        self.assertEqual(self.new_stdout.getvalue().count("Generating Block Headers"), 1)
+
+    def test_generator_quiet_mode(self):
+        gen = generate_block_headers(self.prev_hash, self.merkle_root, self.timestamp, self.bits, max_attempts=101, verbose=False)
+        self.assertEqual(len(list(gen)), 101)
+        self.assertEqual(self.new_stdout.getvalue(), "")
 
 
 if __name__ == '__main__':